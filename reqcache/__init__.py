@@ -2,30 +2,60 @@
 reqcache - A caching wrapper for Python requests library
 
 This module provides TTL-based caching for HTTP requests.
-Cached responses are stored in a local `.cache/` directory using pickle serialization.
+Cached responses are stored in a local `.cache/` directory, sharded by
+key prefix, as flat records: a 4-byte format magic, an 8-byte length prefix, an orjson
+metadata header (status, headers, url, encoding, cookies, timestamps),
+then the raw (optionally zstd-compressed) body bytes. No object graph
+is ever serialized, so loads are a C-level JSON decode plus one body
+slice.
 Use cache_ttl parameter to control caching behavior:
 - 0: No caching
 - -1: Permanent caching
 - >0: Cache for specified seconds (default: 86400)
 """
 
+import atexit
+import functools
 import hashlib
 import json
+import math
+import mmap
 import os
-import pickle
+import struct
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict, Optional, Union
-from urllib.parse import parse_qs, urlencode, urlparse
+from contextlib import contextmanager
+from threading import Lock, Thread, local
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
+import orjson
 import requests
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional accelerator
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional accelerator
+    blake3 = None
+
+try:
+    import zstandard as zstd
+except ImportError:  # pragma: no cover - optional accelerator
+    zstd = None
 from requests import Response
+from requests.cookies import cookiejar_from_dict
+from requests.structures import CaseInsensitiveDict
 
 __version__ = "1.0.0"
 __all__ = [
     "get", "post", "put", "delete", "patch", "head", "options",
-    "request", "clear_cache", "get_cache_info",
+    "request", "batch", "clear_cache", "get_cache_info",
     "TTL_DISABLED", "TTL_PERMANENT", "TTL_ONE_DAY"
 ]
 
@@ -38,9 +68,154 @@ TTL_ONE_DAY = 86400  # 24 hours in seconds
 DEFAULT_CACHE_DIR = ".cache"
 DEFAULT_TTL = TTL_ONE_DAY
 
-# Thread lock for cache operations
+
+@functools.lru_cache(maxsize=8)
+def _pdir(cache_dir: str) -> Path:
+    """Memoized Path for a cache directory, so hot paths skip PurePath parsing."""
+    return Path(cache_dir)
+
+# Disk cache size cap; least-recently-used entries are evicted once the
+# total exceeds this, down to _EVICT_WATERMARK of the cap
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+_EVICT_WATERMARK = 0.9
+
+# Compress cached bodies with zstd when the package is installed;
+# disable by setting REQCACHE_COMPRESS=0. Entries carry a per-file flag
+# so compressed and plain files coexist. Level 1 compresses faster than
+# the disk can write while still shrinking typical API JSON several
+# fold; bodies under one page aren't worth the frame overhead.
+_COMPRESS = zstd is not None and os.environ.get("REQCACHE_COMPRESS", "1") != "0"
+_ZSTD_LEVEL = 1
+_ZSTD_MIN_SIZE = 4096
+
+# Lock guarding the in-memory tier
 _cache_lock = Lock()
 
+# Per-thread state for batch(): while a batch is open, disk writes are
+# buffered here (keyed by cache key, so a URL re-fetched in the batch is
+# written once) and flushed when the block exits
+_batch_local = local()
+
+# Cache keys are split <shard prefix>/<remainder>; the prefix selects
+# one of 256 shard subdirectories
+_SHARD_WIDTH = 2
+
+# Per-shard locks for disk I/O so operations on unrelated keys don't
+# serialize on a single mutex
+_LOCKS = [Lock() for _ in range(16)]
+
+
+def _shard_lock(cache_key: str) -> Lock:
+    """Return the lock guarding the shard this cache key lives in."""
+    return _LOCKS[int(cache_key[:_SHARD_WIDTH], 16) & 15]
+
+
+# Lock and running total (in bytes) for disk-cache eviction bookkeeping
+_evict_lock = Lock()
+_disk_bytes: Optional[int] = None
+
+
+def _scan_cache_files() -> list:
+    """Return (atime, size, path) for every cache file on disk."""
+    entries = []
+    for cache_file in _pdir(DEFAULT_CACHE_DIR).glob("*/*.rc"):
+        try:
+            st = cache_file.stat()
+            entries.append((st.st_atime, st.st_size, cache_file))
+        except OSError:
+            pass
+    return entries
+
+
+def _evict_if_over_cap(added_bytes: int) -> None:
+    """
+    Track disk usage and evict least-recently-used entries when the
+    cache exceeds MAX_CACHE_BYTES, down to the eviction watermark.
+    """
+    global _disk_bytes
+
+    with _evict_lock:
+        if _disk_bytes is None:
+            _disk_bytes = sum(size for _, size, _ in _scan_cache_files())
+        else:
+            _disk_bytes += added_bytes
+
+        if _disk_bytes <= MAX_CACHE_BYTES:
+            return
+
+        entries = sorted(_scan_cache_files())
+        total = sum(size for _, size, _ in entries)
+        target = MAX_CACHE_BYTES * _EVICT_WATERMARK
+        for _, size, cache_file in entries:
+            if total <= target:
+                break
+            try:
+                cache_file.unlink()
+                total -= size
+                if _known is not None:
+                    _known.discard(cache_file.parent.name + cache_file.name.split(".", 1)[0])
+            except OSError:
+                pass
+        _disk_bytes = total
+
+# In-memory L1 cache in front of the disk cache.
+# Maps cache_key -> (expires_at, record) in LRU order, bounded by
+# _MEM_MAX entries, so hot URLs skip file I/O and deserialization
+# entirely and freshness is a single float compare. Records are
+# immutable tuples, never live Response objects: concurrent readers can
+# share them without locking beyond the LRU bookkeeping, and each hit
+# gets its own Response so one caller mutating a result (e.g. setting
+# .encoding) can't corrupt another's.
+# Capacity is tunable via REQCACHE_MEM_MAX (0 disables the tier).
+_mem_cache: "OrderedDict[str, tuple]" = OrderedDict()
+try:
+    _MEM_MAX = int(os.environ.get("REQCACHE_MEM_MAX", "1024"))
+except ValueError:
+    _MEM_MAX = 1024
+
+
+def _expires_at(timestamp: float, ttl: int) -> float:
+    """Absolute expiry time for an entry (inf for permanent entries)."""
+    return math.inf if ttl == TTL_PERMANENT else timestamp + ttl
+
+
+def _mem_record(response: Response) -> tuple:
+    """Immutable snapshot of a Response for the in-memory tier."""
+    return (
+        response.status_code,
+        tuple(response.headers.items()),
+        response.content,
+        response.url,
+        response.encoding,
+        tuple(response.cookies.items()) if response.cookies else (),
+    )
+
+
+def _mem_response(record: tuple) -> Response:
+    """Build a fresh Response from a memory-tier record.
+
+    The body bytes are immutable and shared with the record rather than
+    copied, so a hit costs one Response construction and nothing else.
+    """
+    status_code, headers, content, url, encoding, cookies = record
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response.encoding = encoding
+    if cookies:
+        response.cookies = cookiejar_from_dict(dict(cookies))
+    response._content = content
+    return response
+
+
+def _mem_cache_put(cache_key: str, response: Response, expires_at: float) -> None:
+    """Insert an entry into the in-memory tier, evicting the oldest if full."""
+    _mem_cache[cache_key] = (expires_at, _mem_record(response))
+    _mem_cache.move_to_end(cache_key)
+    while len(_mem_cache) > _MEM_MAX:
+        _mem_cache.popitem(last=False)
+
 
 def _generate_cache_key(
     method: str,
@@ -60,67 +235,374 @@ def _generate_cache_key(
         json_data: JSON request body
 
     Returns:
-        SHA256 hash of the cache key components
+        128-bit hex digest of the cache key components (xxh3 or blake3
+        when available, blake2b otherwise)
     """
-    # Parse URL to normalize it
-    parsed = urlparse(url)
-
-    # Build normalized URL without query string
-    normalized_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    # Normalize the method once; the derivation below assumes uppercase
+    if not method.isupper():
+        method = method.upper()
 
-    # Combine query parameters from URL and params argument
-    url_params = parse_qs(parsed.query)
+    # Flatten params to a hashable tuple of (key, value) string pairs
     if params:
-        # Convert params to same format as parse_qs for consistency
+        flat = []
         for key, value in params.items():
             if isinstance(value, list):
-                url_params[key] = value
+                flat.extend((key, str(v)) for v in value)
             else:
-                url_params[key] = [str(value)]
-
-    # Sort parameters for consistent hashing
-    sorted_params = sorted(url_params.items())
-    params_string = urlencode(sorted_params, doseq=True)
+                flat.append((key, str(value)))
+        params_key = tuple(flat)
+    else:
+        params_key = ()
 
-    # Hash request body if present
-    body_hash = ""
+    # Reduce the request body to bytes
     if json_data is not None:
         # Sort JSON keys for consistent hashing
-        body_hash = hashlib.sha256(
-            json.dumps(json_data, sort_keys=True).encode()
-        ).hexdigest()
-    elif data is not None:
-        if isinstance(data, dict):
-            body_hash = hashlib.sha256(
-                urlencode(sorted(data.items())).encode()
-            ).hexdigest()
-        elif isinstance(data, bytes):
-            body_hash = hashlib.sha256(data).hexdigest()
-        elif isinstance(data, str):
-            body_hash = hashlib.sha256(data.encode()).hexdigest()
+        body = json.dumps(json_data, sort_keys=True).encode()
+    elif isinstance(data, dict):
+        body = urlencode(sorted(data.items())).encode()
+    elif isinstance(data, bytes):
+        body = data
+    elif isinstance(data, (bytearray, memoryview)):
+        body = bytes(data)
+    elif isinstance(data, str):
+        body = data.encode()
+    else:
+        body = b""
+
+    # Don't let the memo pin large request bodies in memory; hash those
+    # directly through the undecorated function
+    if len(body) > 16384:
+        return _derive_cache_key.__wrapped__(method, url, params_key, body)
+    return _derive_cache_key(method, url, params_key, body)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_urlsplit(url: str):
+    return urlsplit(url)
+
+
+def _split_url(url: str):
+    """
+    urlsplit with memoization for the common repeated-URL case.
+
+    URLs carrying embedded credentials are parsed uncached so secrets
+    aren't pinned in the memo.
+    """
+    if "@" in url:
+        return urlsplit(url)
+    return _cached_urlsplit(url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _derive_cache_key(
+    method: str,
+    url: str,
+    params_key: tuple,
+    body: bytes,
+) -> str:
+    """
+    Derive the hex cache key for normalized request components.
 
-    # Combine all components
-    key_components = [
-        method.upper(),
-        normalized_url,
-        params_string,
-        body_hash,
-    ]
+    Memoized so loops hitting the same endpoint repeatedly pay for URL
+    parsing, query canonicalization, and hashing only once.
+    """
+    # Parse the URL exactly once; urlsplit skips urlparse's extra
+    # params-segment handling we never use
+    parsed = _split_url(url)
 
-    cache_key = "|".join(key_components)
+    # Build normalized URL without query string
+    normalized_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
-    # Return SHA256 hash for filesystem-safe filename
-    return hashlib.sha256(cache_key.encode()).hexdigest()
+    # Combine query parameters from URL and params argument; requests
+    # with no query at all skip parsing and encoding entirely
+    if not parsed.query and not params_key:
+        params_string = ""
+    else:
+        items = []
+        if parsed.query:
+            items.extend(parse_qsl(parsed.query, keep_blank_values=True))
+        items.extend(params_key)
+
+        # Sort parameters for consistent hashing
+        items.sort()
+        params_string = urlencode(items)
+
+    # Stream every component into a single hasher; no intermediate digests
+    # or joined strings to re-encode and re-hash. A local cache key needs
+    # collision resistance, not cryptographic strength, so prefer the
+    # fastest 128-bit hash installed: xxh3 (~10 GB/s), then blake3, then
+    # hashlib's blake2b. All three give 32-hex-char filenames.
+    if xxhash is not None:
+        h = xxhash.xxh3_128()
+    elif blake3 is not None:
+        h = blake3.blake3()
+    else:
+        h = hashlib.blake2b(digest_size=16)
+    h.update(method.encode())
+    h.update(b"\x00")
+    h.update(normalized_url.encode())
+    h.update(b"\x00")
+    h.update(params_string.encode())
+    h.update(b"\x00")
+    h.update(body)
+
+    # Return a short filesystem-safe hex filename (128 bits)
+    if xxhash is None and blake3 is not None:
+        return h.hexdigest(length=16)
+    return h.hexdigest()
+
+
+def _get_cache_path(cache_key: str, ttl: int, timestamp: float) -> str:
+    """
+    Get the file path for a cache key saved now with the given TTL.
+
+    Entries are sharded into 256 subdirectories by the first two hex
+    chars of the key (like git objects) so no single directory grows
+    unbounded and lookups stay fast. The absolute expiry time (epoch
+    milliseconds, or 'perm' for permanent entries) is encoded in the
+    filename, so expiry is decided from the name alone — no stat, read,
+    or deserialization.
+
+    Returns a plain string: save and load run on every request, and
+    PurePath construction is pure interpreter overhead there (forward
+    slashes are accepted by the filesystem APIs on every platform).
+    """
+    if ttl == TTL_PERMANENT:
+        token = "perm"
+    else:
+        token = str(int((timestamp + ttl) * 1000))
+    return f"{DEFAULT_CACHE_DIR}/{cache_key[:_SHARD_WIDTH]}/{cache_key[_SHARD_WIDTH:]}.{token}.rc"
 
 
-def _get_cache_path(cache_key: str) -> Path:
-    """Get the file path for a cache key."""
-    return Path(DEFAULT_CACHE_DIR) / f"{cache_key}.pkl"
+# Keys known to exist on disk, so misses for never-seen keys skip the
+# filesystem entirely. Lazily seeded by one scandir sweep; stale
+# positives are harmless (the subsequent lookup just misses).
+_known: Optional[set] = None
 
 
-def _ensure_cache_dir() -> None:
-    """Create cache directory if it doesn't exist."""
-    Path(DEFAULT_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+def _known_keys() -> set:
+    """Return the set of cache keys present on disk, seeding it lazily."""
+    global _known
+    if _known is None:
+        keys = set()
+        try:
+            with os.scandir(DEFAULT_CACHE_DIR) as shards:
+                for shard in shards:
+                    if not shard.is_dir(follow_symlinks=False):
+                        continue
+                    with os.scandir(shard.path) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(".rc"):
+                                keys.add(shard.name + entry.name.split(".", 1)[0])
+        except FileNotFoundError:
+            pass
+        _known = keys
+    return _known
+
+
+def _find_cache_path(cache_key: str) -> Optional[str]:
+    """Locate the cache file for a key, whatever TTL it was saved with."""
+    prefix = f"{cache_key[_SHARD_WIDTH:]}."
+    try:
+        with os.scandir(f"{DEFAULT_CACHE_DIR}/{cache_key[:_SHARD_WIDTH]}") as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith(".rc"):
+                    return entry.path
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _expiry_from_name(name: str) -> float:
+    """Parse the expiry time encoded in a cache filename ('<key>.<expiry_ms>.rc')."""
+    token = name[:-3].rsplit(".", 1)[1]
+    return math.inf if token == "perm" else int(token) / 1000.0
+
+
+# Cache file framing: 4-byte format magic (bumped whenever the layout
+# changes, so stale-format files read as corrupt and fall back to the
+# network instead of misparsing), then an 8-byte prefix of (header
+# length, body length) as two little-endian uint32s, then the orjson
+# header, then the raw body
+_MAGIC = b"RC2\x00"
+_FRAME = struct.Struct("<II")
+
+# Entries larger than this are read via mmap so the page cache backs the
+# parse directly instead of copying into a userspace read buffer first
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _serialize_response(response: Response, ttl: int, timestamp: float) -> Tuple[bytes, bytes]:
+    """
+    Serialize a response as a length-prefixed orjson envelope plus the
+    raw body.
+
+    Only the observable response fields are stored (status, headers, url,
+    encoding, cookies, body) — never connection or adapter internals.
+    The body is returned out of band rather than concatenated into the
+    envelope, so multi-MB payloads are never copied into a new buffer.
+
+    Returns:
+        Tuple of (frame prefix + metadata header, body bytes)
+    """
+    content = response.content or b""
+    compressed = 0
+    if _COMPRESS and len(content) >= _ZSTD_MIN_SIZE:
+        content = zstd.compress(content, _ZSTD_LEVEL)
+        compressed = 1
+    header = orjson.dumps({
+        "sc": response.status_code,
+        "h": list(response.headers.items()),
+        "u": response.url,
+        "enc": response.encoding,
+        "ck": response.cookies.get_dict(),
+        "ts": timestamp,
+        "ttl": ttl,
+        "z": compressed,
+    })
+    return _MAGIC + _FRAME.pack(len(header), len(content)) + header, content
+
+
+def _deserialize_response(buf: bytes) -> Tuple[Response, float, int]:
+    """
+    Rebuild a Response from the full contents of a cache file.
+
+    Returns:
+        Tuple of (response, timestamp, ttl)
+    """
+    view = memoryview(buf)
+    if view[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("unrecognized cache file format")
+    header_len, body_len = _FRAME.unpack_from(buf, len(_MAGIC))
+    offset = len(_MAGIC) + _FRAME.size
+    meta = orjson.loads(view[offset:offset + header_len])
+    if body_len:
+        content = bytes(view[offset + header_len:offset + header_len + body_len])
+    else:
+        content = b""
+    if meta.get("z"):
+        if zstd is None:
+            # Entry written by an environment with zstandard installed;
+            # treat as unreadable (caller handles it as a cache miss)
+            raise ValueError("cache entry is zstd-compressed")
+        content = zstd.decompress(content)
+
+    response = Response()
+    response.status_code = meta["sc"]
+    response.headers = CaseInsensitiveDict(meta["h"])
+    response.url = meta["u"]
+    response.encoding = meta["enc"]
+    if meta["ck"]:
+        # Response.__init__ already made an empty jar; only replace it
+        # when there are cookies to restore
+        response.cookies = cookiejar_from_dict(meta["ck"])
+    response._content = content
+    return response, meta["ts"], meta["ttl"]
+
+
+# Background sweeper that periodically drops expired entries so readers
+# and get_cache_info don't accumulate dead files between accesses
+_SWEEP_INTERVAL = 300
+_sweeper_started = False
+_sweeper_guard = Lock()
+
+
+def _sweep_expired() -> int:
+    """Unlink every expired cache file. Returns the number removed."""
+    count = 0
+    now = time.time()
+    try:
+        with os.scandir(DEFAULT_CACHE_DIR) as shards:
+            for shard in shards:
+                if not shard.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(shard.path) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".rc"):
+                            continue
+                        try:
+                            if now >= _expiry_from_name(entry.name):
+                                os.unlink(entry.path)
+                                count += 1
+                                if _known is not None:
+                                    _known.discard(shard.name + entry.name.split(".", 1)[0])
+                        except (OSError, ValueError):
+                            pass
+    except FileNotFoundError:
+        pass
+    return count
+
+
+def _sweeper() -> None:
+    """Daemon loop: sweep expired entries every _SWEEP_INTERVAL seconds."""
+    while True:
+        time.sleep(_SWEEP_INTERVAL)
+        _sweep_expired()
+
+
+def _start_sweeper() -> None:
+    """Start the background sweeper thread once per process."""
+    global _sweeper_started
+    if _sweeper_started:
+        return
+    with _sweeper_guard:
+        if _sweeper_started:
+            return
+        Thread(target=_sweeper, name="reqcache-sweeper", daemon=True).start()
+        _sweeper_started = True
+
+
+# Directory fd for the cache root, held open across loads so each open
+# resolves only the shard-relative suffix instead of walking the full
+# path from the working directory. Lazily opened; dropped and reopened
+# if the directory is replaced out from under us.
+_dirfd: Optional[int] = None
+_dirfd_lock = Lock()
+
+
+def _cache_dir_fd() -> Optional[int]:
+    """Return an open fd for the cache root, or None if unsupported."""
+    global _dirfd
+    fd = _dirfd
+    if fd is not None:
+        return fd
+    if not hasattr(os, "O_DIRECTORY") or os.open not in os.supports_dir_fd:
+        return None  # pragma: no cover - non-POSIX fallback
+    with _dirfd_lock:
+        if _dirfd is None:
+            try:
+                _dirfd = os.open(DEFAULT_CACHE_DIR, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                return None
+        return _dirfd
+
+
+def _close_cache_dir_fd() -> None:
+    """Close the cached directory fd (it reopens lazily on next use)."""
+    global _dirfd
+    with _dirfd_lock:
+        if _dirfd is not None:
+            try:
+                os.close(_dirfd)
+            except OSError:
+                pass
+            _dirfd = None
+
+
+atexit.register(_close_cache_dir_fd)
+
+
+# Shard directories already created this process; lets saves skip the
+# mkdir syscall after the first write to a shard
+_ensured_dirs: set = set()
+
+
+def _ensure_cache_dir(shard_dir: str) -> None:
+    """Create a cache shard directory if it doesn't exist (once per process)."""
+    if shard_dir in _ensured_dirs:
+        return
+    os.makedirs(shard_dir, exist_ok=True)
+    _ensured_dirs.add(shard_dir)
 
 
 def _save_to_cache(
@@ -140,18 +622,70 @@ def _save_to_cache(
     if ttl == TTL_DISABLED:
         return
 
-    with _cache_lock:
-        _ensure_cache_dir()
+    # Inside a batch() block: defer the disk write, but populate the
+    # memory tier now so repeats of the same URL within the batch are
+    # still served from cache
+    pending = getattr(_batch_local, "pending", None)
+    if pending is not None:
+        pending[cache_key] = (response, ttl)
+        with _cache_lock:
+            _mem_cache_put(cache_key, response, _expires_at(time.time(), ttl))
+        return
 
-        cache_data = {
-            "timestamp": time.time(),
-            "ttl": ttl,
-            "response": response,
-        }
+    timestamp = time.time()
+    shard_dir = f"{DEFAULT_CACHE_DIR}/{cache_key[:_SHARD_WIDTH]}"
+    cache_path = _get_cache_path(cache_key, ttl, timestamp)
 
-        cache_path = _get_cache_path(cache_key)
-        with open(cache_path, "wb") as f:
-            pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    header, body = _serialize_response(response, ttl, timestamp)
+    with _shard_lock(cache_key):
+        _ensure_cache_dir(shard_dir)
+        # Drop any variant of this key saved with a different TTL
+        prefix = f"{cache_key[_SHARD_WIDTH:]}."
+        cache_name = cache_path.rsplit("/", 1)[1]
+        try:
+            with os.scandir(shard_dir) as entries:
+                for entry in entries:
+                    if (entry.name.startswith(prefix)
+                            and entry.name.endswith(".rc")
+                            and entry.name != cache_name):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+        except FileNotFoundError:
+            pass
+        # Write to a temp file and publish atomically so readers never
+        # observe a half-written entry. No fsync: this is a cache, so
+        # losing the last few entries in a power cut is fine and the OS
+        # page cache flushes asynchronously.
+        tmp_path = cache_path + ".tmp"
+        for _ in range(2):
+            try:
+                # Raw fd writes skip the buffered-IO layer and its flush;
+                # writev lands header and body in one syscall where available
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                try:
+                    if hasattr(os, "writev"):
+                        os.writev(fd, (header, body))
+                    else:  # pragma: no cover - non-POSIX fallback
+                        os.write(fd, header)
+                        os.write(fd, body)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, cache_path)
+                break
+            except FileNotFoundError:
+                # Shard dir removed behind our back; recreate and retry
+                _ensured_dirs.discard(shard_dir)
+                _ensure_cache_dir(shard_dir)
+
+    _known_keys().add(cache_key)
+    _evict_if_over_cap(len(header) + len(body))
+    _start_sweeper()
+
+    # Populate the in-memory tier so the next hit skips disk entirely
+    with _cache_lock:
+        _mem_cache_put(cache_key, response, _expires_at(timestamp, ttl))
 
 
 def _load_from_cache(
@@ -166,29 +700,77 @@ def _load_from_cache(
     Returns:
         Cached Response object if valid, None otherwise
     """
-    cache_path = _get_cache_path(cache_key)
+    # Check the in-memory tier first (hot path: no file I/O at all)
+    with _cache_lock:
+        entry = _mem_cache.get(cache_key)
+        if entry is not None:
+            expires_at, record = entry
+            if time.time() >= expires_at:
+                # Expired in memory implies expired on disk too
+                del _mem_cache[cache_key]
+                return None
+            _mem_cache.move_to_end(cache_key)
+            return _mem_response(record)
 
-    if not cache_path.exists():
+    # Negative lookup: keys never saved don't pay any syscalls
+    if cache_key not in _known_keys():
         return None
 
-    try:
-        with _cache_lock:
-            with open(cache_path, "rb") as f:
-                cache_data = pickle.load(f)
+    cache_path = _find_cache_path(cache_key)
 
-        # Validate TTL
-        timestamp = cache_data.get("timestamp", 0)
-        ttl = cache_data.get("ttl", DEFAULT_TTL)
+    if cache_path is None:
+        return None
 
-        # Check expiration (skip for permanent cache TTL=-1)
-        if ttl != TTL_PERMANENT:
-            if time.time() - timestamp > ttl:
-                # Cache expired
-                return None
+    try:
+        # Freshness check from the filename alone, so expired entries
+        # never pay for a stat, read, or deserialization
+        if time.time() >= _expiry_from_name(cache_path.rsplit(os.sep, 1)[1]):
+            with _shard_lock(cache_key):
+                try:
+                    os.unlink(cache_path)
+                except OSError:
+                    pass
+            _known_keys().discard(cache_key)
+            return None
+
+        with _shard_lock(cache_key):
+            # One read for the whole entry instead of a stream of small
+            # reads; large entries are parsed straight from an mmap of
+            # the page cache rather than an intermediate copy. Opening
+            # relative to the held cache-root fd skips re-resolving the
+            # leading path components on every hit.
+            fd = -1
+            dirfd = _cache_dir_fd()
+            if dirfd is not None:
+                try:
+                    fd = os.open(cache_path[len(DEFAULT_CACHE_DIR) + 1:],
+                                 os.O_RDONLY, dir_fd=dirfd)
+                except FileNotFoundError:
+                    # Either the entry vanished or the cache root was
+                    # replaced and the fd is stale; drop it and let the
+                    # full-path open below decide which
+                    _close_cache_dir_fd()
+            if fd < 0:
+                fd = os.open(cache_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                if size > _MMAP_THRESHOLD:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                        response, timestamp, ttl = _deserialize_response(mm)
+                else:
+                    buf = os.read(fd, size)
+                    response, timestamp, ttl = _deserialize_response(buf)
+            finally:
+                os.close(fd)
+            # Touch atime (keep mtime) so LRU eviction sees this as recent
+            st = os.stat(cache_path)
+            os.utime(cache_path, (time.time(), st.st_mtime))
 
-        return cache_data.get("response")
+        with _cache_lock:
+            _mem_cache_put(cache_key, response, _expires_at(timestamp, ttl))
+        return response
 
-    except (pickle.PickleError, OSError, KeyError):
+    except (orjson.JSONDecodeError, struct.error, OSError, KeyError, TypeError, ValueError):
         # Corrupted cache file or missing fields
         return None
 
@@ -197,6 +779,7 @@ def request(
     method: str,
     url: str,
     cache_ttl: int = DEFAULT_TTL,
+    cacheable_statuses: Optional[Any] = None,
     **kwargs
 ) -> Response:
     """
@@ -209,13 +792,17 @@ def request(
                   - 0: No caching (passes through to requests)
                   - -1: Permanent caching (no expiration)
                   - >0: Cache for specified seconds (default: 86400)
+        cacheable_statuses: Optional collection of status codes to cache.
+                  By default only successful responses (response.ok) are
+                  cached, so 4xx/5xx errors don't pollute the cache.
         **kwargs: Additional arguments passed to requests.request()
 
     Returns:
         Response object (cached or fresh)
     """
-    # Validate cache_ttl parameter
-    if not isinstance(cache_ttl, int):
+    # Validate cache_ttl parameter. The exact-type check is a pointer
+    # compare (no isinstance MRO walk) and rejects bools for free.
+    if type(cache_ttl) is not int:
         raise ValueError(f"cache_ttl must be an integer, got {type(cache_ttl).__name__}")
     if cache_ttl < -1:
         raise ValueError(f"cache_ttl must be -1, 0, or positive, got {cache_ttl}")
@@ -241,8 +828,12 @@ def request(
     # Cache miss - make actual request
     response = requests.request(method, url, **kwargs)
 
-    # Save to cache
-    _save_to_cache(cache_key, response, cache_ttl)
+    # Save to cache; errors are skipped unless explicitly whitelisted
+    if cacheable_statuses is not None:
+        if response.status_code in cacheable_statuses:
+            _save_to_cache(cache_key, response, cache_ttl)
+    elif response.ok:
+        _save_to_cache(cache_key, response, cache_ttl)
 
     return response
 
@@ -282,6 +873,50 @@ def options(url: str, cache_ttl: int = DEFAULT_TTL, **kwargs) -> Response:
     return request("OPTIONS", url, cache_ttl=cache_ttl, **kwargs)
 
 
+@contextmanager
+def batch():
+    """
+    Context manager that coalesces cache writes.
+
+    Disk writes issued inside the block are buffered (responses are
+    still cached in memory immediately) and flushed together on exit,
+    so a burst of requests pays for directory checks, stale-variant
+    cleanup and eviction bookkeeping once per key instead of
+    interleaving them with network calls. A URL fetched several times
+    inside the block is written to disk only once.
+
+    Usage:
+        with reqcache.batch():
+            for url in urls:
+                reqcache.get(url)
+
+    The buffer is per-thread; nested batch() blocks join the outermost
+    one.
+    """
+    if getattr(_batch_local, "pending", None) is not None:
+        # Already inside a batch on this thread; the outermost block flushes
+        yield
+        return
+
+    _batch_local.pending = {}
+    try:
+        yield
+    finally:
+        pending = _batch_local.pending
+        _batch_local.pending = None
+        for cache_key, (response, ttl) in pending.items():
+            _save_to_cache(cache_key, response, ttl)
+
+
+def _safe_unlink(path) -> int:
+    """Unlink a cache file, returning 1 on success and 0 on failure."""
+    try:
+        os.unlink(path)
+        return 1
+    except OSError:
+        return 0
+
+
 def clear_cache() -> int:
     """
     Clear all cached responses.
@@ -289,21 +924,43 @@ def clear_cache() -> int:
     Returns:
         Number of cache files deleted
     """
-    cache_path = Path(DEFAULT_CACHE_DIR)
+    cache_path = _pdir(DEFAULT_CACHE_DIR)
 
     if not cache_path.exists():
         return 0
 
-    count = 0
     with _cache_lock:
-        for cache_file in cache_path.glob("*.pkl"):
-            try:
-                cache_file.unlink()
-                count += 1
-            except OSError:
-                pass
+        _mem_cache.clear()
 
-    return count
+    global _disk_bytes, _known
+    with _evict_lock:
+        _disk_bytes = 0
+    _known = set()
+    _close_cache_dir_fd()
+
+    # Collect paths with scandir (no per-entry Path construction or
+    # extra stat calls, unlike glob)
+    files = []
+    try:
+        with os.scandir(cache_path) as shards:
+            for shard in shards:
+                if not shard.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(shard.path) as entries:
+                    # Also sweep any .rc.tmp files left by interrupted saves
+                    files.extend(
+                        entry.path for entry in entries
+                        if entry.name.endswith((".rc", ".rc.tmp"))
+                    )
+    except FileNotFoundError:
+        return 0
+    if not files:
+        return 0
+
+    # Each unlink is an independent syscall; fan them out instead of
+    # deleting sequentially under a lock
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return sum(executor.map(_safe_unlink, files))
 
 
 def get_cache_info() -> Dict[str, Any]:
@@ -313,7 +970,7 @@ def get_cache_info() -> Dict[str, Any]:
     Returns:
         Dictionary with cache statistics
     """
-    cache_path = Path(DEFAULT_CACHE_DIR)
+    cache_path = _pdir(DEFAULT_CACHE_DIR)
 
     if not cache_path.exists():
         return {
@@ -330,29 +987,26 @@ def get_cache_info() -> Dict[str, Any]:
     valid_entries = 0
     expired_entries = 0
 
-    for cache_file in cache_path.glob("*.pkl"):
-        total_files += 1
-        try:
-            total_size += cache_file.stat().st_size
-
-            # Check if entry is valid
-            with open(cache_file, "rb") as f:
-                cache_data = pickle.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            ttl = cache_data.get("ttl", DEFAULT_TTL)
-
-            # Check expiration (skip for permanent cache TTL=-1)
-            if ttl != TTL_PERMANENT:
-                if time.time() - timestamp <= ttl:
-                    valid_entries += 1
-                else:
-                    expired_entries += 1
-            else:
-                valid_entries += 1
-
-        except (OSError, pickle.PickleError, KeyError):
-            expired_entries += 1
+    # One scandir pass per shard: size from the cached stat, validity
+    # from the filename TTL and mtime — no file is ever opened
+    now = time.time()
+    with os.scandir(cache_path) as shards:
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(shard.path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".rc"):
+                        continue
+                    total_files += 1
+                    try:
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                        if now < _expiry_from_name(entry.name):
+                            valid_entries += 1
+                        else:
+                            expired_entries += 1
+                    except (OSError, ValueError):
+                        expired_entries += 1
 
     return {
         "exists": True,
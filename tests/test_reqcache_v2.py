@@ -4,8 +4,8 @@ Tests for reqcache library v2.0.0 - TTL-only API
 
 import json
 import os
-import pickle
 import shutil
+import struct
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -32,12 +32,14 @@ def create_mock_response(status_code=200, text="", content=None, headers=None):
 
 @pytest.fixture(autouse=True)
 def cleanup_cache():
-    """Clean up cache directory before and after each test."""
+    """Clean up cache directory and in-memory tier before and after each test."""
     # Before test
+    reqcache._mem_cache.clear()
     if Path(reqcache.DEFAULT_CACHE_DIR).exists():
         shutil.rmtree(reqcache.DEFAULT_CACHE_DIR)
     yield
     # After test
+    reqcache._mem_cache.clear()
     if Path(reqcache.DEFAULT_CACHE_DIR).exists():
         shutil.rmtree(reqcache.DEFAULT_CACHE_DIR)
 
@@ -139,7 +141,7 @@ class TestCacheEnabled:
 
         # Verify cache directory was created
         assert Path(reqcache.DEFAULT_CACHE_DIR).exists()
-        cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*.pkl"))
+        cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*/*.rc"))
         assert len(cache_files) == 1
 
     @patch('requests.request')
@@ -175,12 +177,14 @@ class TestCacheEnabled:
         assert mock_request.call_count == 1
 
         # Verify cache data has TTL=-1
-        cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*.pkl"))
+        cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*/*.rc"))
         assert len(cache_files) == 1
 
         with open(cache_files[0], 'rb') as f:
-            cache_data = pickle.load(f)
-        assert cache_data['ttl'] == reqcache.TTL_PERMANENT
+            assert f.read(4) == reqcache._MAGIC
+            header_len, _ = struct.unpack("<II", f.read(8))
+            meta = json.loads(f.read(header_len))
+        assert meta['ttl'] == reqcache.TTL_PERMANENT
 
     @patch('requests.request')
     def test_cache_expiration(self, mock_request):
@@ -213,6 +217,106 @@ class TestCacheEnabled:
         assert call_count == 2
 
 
+class TestMemoryCache:
+    """Tests for the in-memory L1 cache tier."""
+
+    @patch('requests.request')
+    def test_memory_tier_hit_without_disk(self, mock_request):
+        """Test that repeat hits are served from memory even if disk files vanish."""
+        mock_response = create_mock_response(text="memory response")
+        mock_request.return_value = mock_response
+
+        # First request populates both tiers
+        reqcache.get("https://example.com/mem")
+        assert mock_request.call_count == 1
+
+        # Remove the disk cache; the memory tier should still serve the hit
+        shutil.rmtree(reqcache.DEFAULT_CACHE_DIR)
+        response = reqcache.get("https://example.com/mem")
+        assert response.text == "memory response"
+        assert mock_request.call_count == 1
+
+    @patch('requests.request')
+    def test_memory_tier_respects_expiry(self, mock_request):
+        """Test that expired memory entries are not served."""
+        mock_response = create_mock_response(text="short lived")
+        mock_request.return_value = mock_response
+
+        reqcache.get("https://example.com/mem-ttl", cache_ttl=1)
+        assert mock_request.call_count == 1
+
+        time.sleep(1.1)
+        reqcache.get("https://example.com/mem-ttl", cache_ttl=1)
+        assert mock_request.call_count == 2
+
+    @patch('requests.request')
+    def test_memory_tier_bounded(self, mock_request):
+        """Test that the memory tier never exceeds its entry bound."""
+        mock_response = create_mock_response(text="x")
+        mock_request.return_value = mock_response
+
+        old_max = reqcache._MEM_MAX
+        reqcache._MEM_MAX = 4
+        try:
+            for i in range(10):
+                reqcache.get(f"https://example.com/bound/{i}")
+            assert len(reqcache._mem_cache) <= 4
+        finally:
+            reqcache._MEM_MAX = old_max
+
+
+class TestBatch:
+    """Tests for the batch() write-coalescing context manager."""
+
+    @patch('requests.request')
+    def test_batch_defers_disk_writes(self, mock_request):
+        """Test that writes land on disk only when the batch exits."""
+        mock_response = create_mock_response(text="batched")
+        mock_request.return_value = mock_response
+
+        with reqcache.batch():
+            reqcache.get("https://example.com/a")
+            reqcache.get("https://example.com/b")
+            # Repeat of a buffered URL is served from memory, not refetched
+            reqcache.get("https://example.com/a")
+            assert mock_request.call_count == 2
+            assert list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*/*.rc")) == []
+
+        cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*/*.rc"))
+        assert len(cache_files) == 2
+
+        # Flushed entries survive a memory-tier flush
+        reqcache._mem_cache.clear()
+        response = reqcache.get("https://example.com/a")
+        assert response.text == "batched"
+        assert mock_request.call_count == 2
+
+
+class TestDiskEviction:
+    """Tests for the disk cache size cap."""
+
+    @patch('requests.request')
+    def test_lru_eviction_respects_cap(self, mock_request):
+        """Test that the disk cache is evicted down below the size cap."""
+        mock_request.side_effect = lambda *a, **kw: create_mock_response(text="y" * 1024)
+
+        old_cap = reqcache.MAX_CACHE_BYTES
+        reqcache.MAX_CACHE_BYTES = 4096
+        reqcache._disk_bytes = None
+        try:
+            for i in range(20):
+                reqcache.get(f"https://example.com/evict/{i}")
+
+            total = sum(
+                f.stat().st_size
+                for f in Path(reqcache.DEFAULT_CACHE_DIR).glob("*/*.rc")
+            )
+            assert total <= reqcache.MAX_CACHE_BYTES
+        finally:
+            reqcache.MAX_CACHE_BYTES = old_cap
+            reqcache._disk_bytes = None
+
+
 class TestHTTPMethods:
     """Tests for all HTTP methods with TTL-only API."""
 
@@ -290,7 +394,7 @@ class TestCacheUtilities:
             reqcache.get("https://example.com/2")
 
             # Verify cache files exist
-            cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*.pkl"))
+            cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*/*.rc"))
             assert len(cache_files) == 2
 
             # Clear cache
@@ -298,7 +402,7 @@ class TestCacheUtilities:
             assert result == 2
 
             # Verify cache is empty
-            cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*.pkl"))
+            cache_files = list(Path(reqcache.DEFAULT_CACHE_DIR).glob("*/*.rc"))
             assert len(cache_files) == 0
 
     def test_get_cache_info_empty(self):
@@ -336,8 +440,8 @@ class TestErrorHandling:
     """Tests for error handling."""
 
     @patch('requests.request')
-    def test_http_error_cached(self, mock_request):
-        """Test that HTTP errors are cached."""
+    def test_http_error_not_cached_by_default(self, mock_request):
+        """Test that HTTP errors are not cached by default."""
         mock_response = create_mock_response(status_code=404, text="Not Found")
         mock_request.return_value = mock_response
 
@@ -346,9 +450,29 @@ class TestErrorHandling:
         assert response1.status_code == 404
         assert mock_request.call_count == 1
 
-        # Second request should use cache (even for 404)
+        # Second request should hit the network again (404 not cached)
         response2 = reqcache.get("https://example.com/notfound")
         assert response2.status_code == 404
+        assert mock_request.call_count == 2
+
+    @patch('requests.request')
+    def test_cacheable_statuses_override(self, mock_request):
+        """Test that cacheable_statuses allows caching selected errors."""
+        mock_response = create_mock_response(status_code=404, text="Not Found")
+        mock_request.return_value = mock_response
+
+        # First request with 404 whitelisted
+        response1 = reqcache.get(
+            "https://example.com/notfound", cacheable_statuses={200, 404}
+        )
+        assert response1.status_code == 404
+        assert mock_request.call_count == 1
+
+        # Second request should use cache
+        response2 = reqcache.get(
+            "https://example.com/notfound", cacheable_statuses={200, 404}
+        )
+        assert response2.status_code == 404
         assert mock_request.call_count == 1
 
     @patch('requests.request')